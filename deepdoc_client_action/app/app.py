@@ -4,7 +4,7 @@ import io
 import json
 import time
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import streamlit as st
 from jvclient.lib.utils import call_api, get_reports_payload
@@ -54,6 +54,28 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
             help="Enter the vector store action name",
             key="vector_store_action",
         )
+        # add fields for the DeepDoc transport settings
+        st.session_state[model_key]["connect_timeout"] = st.number_input(
+            "Connect Timeout (seconds)",
+            min_value=0.1,
+            value=float(st.session_state[model_key].get("connect_timeout", 5.0)),
+            help="Maximum time to wait when connecting to the DeepDoc service",
+            key="connect_timeout",
+        )
+        st.session_state[model_key]["read_timeout"] = st.number_input(
+            "Read Timeout (seconds)",
+            min_value=1.0,
+            value=float(st.session_state[model_key].get("read_timeout", 120.0)),
+            help="Maximum time to wait for a response from the DeepDoc service",
+            key="read_timeout",
+        )
+        st.session_state[model_key]["max_retries"] = st.number_input(
+            "Max Retries",
+            min_value=0,
+            value=int(st.session_state[model_key].get("max_retries", 3)),
+            help="Number of retries for transient DeepDoc failures on idempotent calls",
+            key="max_retries",
+        )
 
         # Add update button to apply changes
         app_update_action(agent_id, action_id)
@@ -201,6 +223,8 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                 payload = get_reports_payload(result)
 
                 if payload:
+                    # the new job is listed when the document list is next loaded
+                    st.session_state.document_cache = None
                     # Display number of processed files
                     total_processed = len(doc_uploads) + len(url_list)
                     st.success(
@@ -250,6 +274,133 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+    def reset_pagination() -> None:
+        """Return the document list to its first page, reloading it in full"""
+        st.session_state.current_page = 1
+        st.session_state.page_cursors = [""]
+        st.session_state.document_cache = None
+
+    # seconds between refreshes of the document list from the change feed
+    refresh_interval = 5.0
+
+    def page_key() -> tuple:
+        """Identify the page of jobs currently shown"""
+        return (
+            st.session_state.current_page,
+            st.session_state.per_page,
+            st.session_state.page_cursors[st.session_state.current_page - 1],
+        )
+
+    def fetch_changes(params: dict) -> Optional[dict]:
+        """Call the change feed, which only reads the manifest
+
+        Args:
+            params: The cursor and job_ids to list changes for; none to only
+                obtain a cursor for the present
+
+        Returns:
+            The changed jobs and documents with the next cursor, or None on failure
+        """
+        result = call_api(
+            endpoint="action/walker/deepdoc_client_action/list_changes",
+            json_data={"agent_id": agent_id, "reporting": True, **params},
+        )
+        if result and result.status_code == 200:
+            return get_reports_payload(result)
+        return None
+
+    def load_page() -> None:
+        """Fetch the current page of jobs in full and cache it
+
+        The change feed cursor is taken first, so no change made while the
+        page is fetched is missed.
+        """
+        st.session_state.document_cache = None
+        changes = fetch_changes({})
+        result = call_api(
+            endpoint="action/walker/deepdoc_client_action/list_documents",
+            json_data={
+                "agent_id": agent_id,
+                "page": st.session_state.current_page,
+                "per_page": st.session_state.per_page,
+                "group_by_job": True,
+                "projection": "summary",
+                "cursor": st.session_state.page_cursors[
+                    st.session_state.current_page - 1
+                ],
+                "reporting": True,
+            },
+        )
+        if result and result.status_code == 200:
+            st.session_state.document_cache = {
+                "key": page_key(),
+                "payload": get_reports_payload(result),
+                "cursor": changes.get("next_cursor", "") if changes else "",
+                "refreshed_at": time.monotonic(),
+            }
+
+    def merge_changes(payload: dict, changes: dict) -> bool:
+        """Merge changed jobs and documents into a cached page
+
+        Args:
+            payload: The cached page, as returned by list_documents
+            changes: The changes, as returned by list_changes
+
+        Returns:
+            False when the page must be reloaded instead: too many changes,
+            jobs added or removed, or documents removed from a job shown
+        """
+        if changes.get("has_more") or changes.get("job_count") != payload.get(
+            "total_items"
+        ):
+            return False
+
+        jobs = {job["job_id"]: job for job in payload.get("jobs", [])}
+        for job in changes.get("jobs", []):
+            if job["job_id"] in jobs:
+                jobs[job["job_id"]].update(job)
+        for item in changes.get("items", []):
+            job = jobs.get(item.get("job_id"))
+            if job is None:
+                continue
+            items = job.setdefault("items", [])
+            for index, cached in enumerate(items):
+                if cached.get("id") == item.get("id"):
+                    items[index] = item
+                    break
+            else:
+                items.append(item)
+
+        for job in jobs.values():
+            if job.get("tallied") and sum(
+                job.get("doc_counts", {}).values()
+            ) != len(job.get("items", [])):
+                return False
+
+        payload["items"] = [
+            item for job in payload.get("jobs", []) for item in job.get("items", [])
+        ]
+        return True
+
+    def refresh_page() -> None:
+        """Bring the cached page up to date from the change feed"""
+        cache = st.session_state.document_cache
+        if not cache["cursor"] or not cache["payload"]:
+            load_page()
+            return
+
+        job_ids = [job["job_id"] for job in cache["payload"].get("jobs", [])]
+        changes = fetch_changes({"cursor": cache["cursor"], "job_ids": job_ids})
+        if changes is None:
+            # keep showing the cached page and try again later
+            cache["refreshed_at"] = time.monotonic()
+            return
+        if not merge_changes(cache["payload"], changes):
+            load_page()
+            return
+        cache["cursor"] = changes.get("next_cursor", cache["cursor"])
+        cache["refreshed_at"] = time.monotonic()
+
     def get_status_badge(status: str) -> str:
         """Return a colored badge for the status
 
@@ -275,6 +426,9 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
         # Initialize session state variables for pagination
         if "current_page" not in st.session_state:
             st.session_state.current_page = 1
+        # cursors[i] fetches page i + 1; jobs are paged server-side so none is split across pages
+        if "page_cursors" not in st.session_state:
+            st.session_state.page_cursors = [""]
         if "per_page" not in st.session_state:
             st.session_state.per_page = 25
 
@@ -292,27 +446,26 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
         with col1:
             # Per-page selection dropdown
             per_page = st.selectbox(
-                "Items per page",
+                "Jobs per page",
                 options=[1, 5, 10, 25, 50, 100],
                 index=[1, 5, 10, 25, 50, 100].index(st.session_state.per_page),
                 key="per_page_selector",
-                on_change=lambda: setattr(st.session_state, "current_page", 1),
+                on_change=reset_pagination,
             )
             st.session_state.per_page = per_page
 
-        # Fetch documents with pagination parameters
-        result = call_api(
-            endpoint="action/walker/deepdoc_client_action/list_documents",
-            json_data={
-                "agent_id": agent_id,
-                "page": st.session_state.current_page,
-                "per_page": st.session_state.per_page,
-                "reporting": True,
-            },
-        )
-
-        if result and result.status_code == 200:
-            payload = get_reports_payload(result)
+        # The page is cached across reruns; while it is shown, only the changes
+        # since it was last refreshed are fetched, at most every refresh_interval
+        # seconds, and nothing is retrieved or ingested from here
+        cache = st.session_state.get("document_cache")
+        if not cache or cache["key"] != page_key():
+            load_page()
+        elif time.monotonic() - cache["refreshed_at"] >= refresh_interval:
+            refresh_page()
+        cache = st.session_state.document_cache
+
+        if cache:
+            payload = cache["payload"]
             if payload:
                 document_list = []
                 if (
@@ -334,8 +487,9 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                 with col3:
                     page_col1, page_col2, page_col3 = st.columns([1, 2, 1])
                     with page_col1:
-                        if payload.get("has_previous", False) and st.button("←"):
+                        if st.session_state.current_page > 1 and st.button("←"):
                             st.session_state.current_page -= 1
+                            st.session_state.page_cursors.pop()
                             st.rerun()
                     with page_col2:
                         st.markdown(
@@ -344,21 +498,41 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                     with page_col3:
                         if payload.get("has_next", False) and st.button("→"):
                             st.session_state.current_page += 1
+                            st.session_state.page_cursors.append(
+                                payload.get("next_cursor", "")
+                            )
                             st.rerun()
 
-                # Check if any document is still processing or ingesting
+                # Jobs keep counts of their documents by status, so progress is
+                # read from the jobs; documents are only checked for jobs which
+                # have not been tallied yet
+                job_counts = {
+                    job["job_id"]: job.get("doc_counts", {})
+                    for job in payload.get("jobs", [])
+                    if job.get("tallied")
+                }
+
+                def is_processing(job_id: str, documents: list) -> bool:
+                    if job_id in job_counts:
+                        counts = job_counts[job_id]
+                        return bool(
+                            counts.get("PROCESSING") or counts.get("INGESTING")
+                        )
+                    return any(
+                        doc.get("status") in ("PROCESSING", "INGESTING")
+                        for doc in documents
+                    )
+
+                # Check if any job is still processing or ingesting
                 any_processing = any(
-                    item.get("status") in ("PROCESSING", "INGESTING")
-                    for item in document_list
+                    is_processing(job_id, documents)
+                    for job_id, documents in jobs.items()
                 )
 
                 # Display documents grouped by job_id
                 for job_id, documents in jobs.items():
                     # Check if any document in this job is still processing
-                    job_processing = any(
-                        doc.get("status") in ("PROCESSING", "INGESTING")
-                        for doc in documents
-                    )
+                    job_processing = is_processing(job_id, documents)
 
                     # Horizontal rule between jobs
                     st.markdown("---")
@@ -367,11 +541,9 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                     with rcol1:
                         if job_processing:
                             if st.button("🔄", key=f"refresh_{job_id}"):
-                                # Call retrieve_job to manually update status
-                                call_api(
-                                    endpoint="action/walker/deepdoc_client_action/retrieve_job",
-                                    json_data={"agent_id": agent_id, "job_id": job_id},
-                                )
+                                # Reload the page; the action retrieves and
+                                # ingests jobs itself, on callback or by polling
+                                st.session_state.document_cache = None
                                 st.rerun()
                         else:
                             # a disabled refresh button when not processing
@@ -425,7 +597,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                                         cancel_result
                                         and cancel_result.status_code == 200
                                     ):
-                                        st.session_state.current_page = 1
+                                        reset_pagination()
                                         st.session_state.confirm_state = {
                                             "active": False
                                         }
@@ -474,7 +646,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                                         delete_result
                                         and delete_result.status_code == 200
                                     ):
-                                        st.session_state.current_page = 1
+                                        reset_pagination()
                                         st.session_state.confirm_state = {
                                             "active": False
                                         }
@@ -570,6 +742,7 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                                                 },
                                             )
                                             if delete_result:
+                                                st.session_state.document_cache = None
                                                 st.session_state.confirm_state = {
                                                     "active": False
                                                 }
@@ -608,9 +781,9 @@ def render(router: StreamlitRouter, agent_id: str, action_id: str, info: dict) -
                             else:
                                 st.text("Processing")
 
-                # Auto-refresh every 5 seconds if any documents are processing
+                # Refresh from the change feed while any job is processing
                 if any_processing:
-                    time.sleep(5)
+                    time.sleep(refresh_interval)
                     st.rerun()
 
             else: